@@ -1,7 +1,9 @@
 import json
+import sqlite3
 import sys
 import pandas as pd
-from typing import Dict, Any
+from pathlib import Path
+from typing import Dict, Any, Optional
 from src import config
 from src.layers.loader import load_json
 from src.layers.exporter import export_to_json
@@ -60,6 +62,45 @@ def compute_most_mentioned_journal(df: pd.DataFrame) -> Dict[str, Any]:
         logger.error(f"Erreur lors du calcul des mentions par journal : {e}")
         sys.exit(1)
 
+# Équivalent SQL de compute_most_mentioned_journal, sur la base exportée par export_to_sqlite.
+# En cas d'égalité, le premier journal dans l'ordre alphabétique est retenu, comme avec idxmax.
+MOST_MENTIONED_JOURNAL_QUERY = """
+SELECT journal, COUNT(DISTINCT drug) AS mentions
+FROM mentions
+WHERE journal IS NOT NULL
+GROUP BY journal
+ORDER BY mentions DESC, journal
+LIMIT 1
+"""
+
+
+def compute_most_mentioned_journal_sql(db_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Calcule le journal qui mentionne le plus de médicaments distincts par une requête SQL
+    sur la base SQLite des mentions, sans charger le graphe JSON.
+
+    Args:
+        db_path (Optional[str]): Chemin de la base SQLite. Par défaut, config.SQLITE_OUTPUT_PATH.
+
+    Returns:
+        Dict[str, Any]: Dictionnaire avec les clés 'journal' et 'mentions'.
+    """
+    db_path = db_path or config.SQLITE_OUTPUT_PATH
+    try:
+        # Ouverture en lecture seule : une base absente est signalée au lieu d'être créée vide
+        connection = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            row = connection.execute(MOST_MENTIONED_JOURNAL_QUERY).fetchone()
+        finally:
+            connection.close()
+    except Exception as e:
+        logger.error(f"Erreur lors de la requête SQL sur {db_path} : {e}")
+        sys.exit(1)
+    if row is None:
+        logger.error(f"Aucune mention dans la base SQLite {db_path}.")
+        sys.exit(1)
+    return {"journal": row[0], "mentions": int(row[1])}
+
 def export_most_mentioned_journal() -> Dict[str, Any]:
     """
     Calcule le journal le plus mentionné à partir des données du graphe et exporte
@@ -70,7 +111,30 @@ def export_most_mentioned_journal() -> Dict[str, Any]:
     """
     df = load_graph_data()
     result = compute_most_mentioned_journal(df)
-    
+    return _export_result(result)
+
+def export_most_mentioned_journal_sql() -> Dict[str, Any]:
+    """
+    Calcule le journal le plus mentionné par une requête SQL sur la base SQLite des mentions
+    et exporte le résultat en JSON dans le chemin défini par config.AD_HOC_OUTPUT_PATH.
+
+    Returns:
+        Dict[str, Any]: Le résultat du calcul sous forme de dictionnaire.
+    """
+    result = compute_most_mentioned_journal_sql()
+    return _export_result(result)
+
+def _export_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Affiche le journal le plus mentionné et l'exporte en JSON dans le chemin défini
+    par config.AD_HOC_OUTPUT_PATH.
+
+    Args:
+        result (Dict[str, Any]): Résultat du calcul, avec les clés 'journal' et 'mentions'.
+
+    Returns:
+        Dict[str, Any]: Le résultat exporté.
+    """
     logger.warning("\nLe journal le plus mentionné :\n" + json.dumps(result, indent=4))
     
     try:
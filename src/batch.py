@@ -0,0 +1,101 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+from src.config import resolve_dataset_config
+from src.main import build_and_export_graph
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def run_dataset(data_dir: str) -> Dict[str, Any]:
+    """
+    Exécute la pipeline ETL complète sur un jeu de données.
+
+    Exécutée dans un processus du pool : pandas et les patterns compilés des médicaments
+    (mis en cache par liste de médicaments) restent chargés d'un jeu de données à l'autre.
+
+    Args:
+        data_dir (str): Dossier racine du jeu de données (contenant Raw, Staging et Result).
+
+    Returns:
+        Dict[str, Any]: Dossier traité, durée en secondes mesurée dans le processus, et nombre de
+                        mentions exportées ou, en cas d'échec, l'erreur rencontrée (clé 'error').
+    """
+    start = time.perf_counter()
+    try:
+        graph_data = build_and_export_graph(resolve_dataset_config(data_dir))
+    except (Exception, SystemExit) as e:
+        # La pipeline appelle sys.exit en cas d'erreur
+        return {"data_dir": data_dir, "seconds": time.perf_counter() - start, "error": repr(e)}
+    return {
+        "data_dir": data_dir,
+        "seconds": time.perf_counter() - start,
+        "mentions": sum(len(mentions) for mentions in graph_data.values())
+    }
+
+
+def run_batch(data_dirs: List[str], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Exécute la pipeline ETL sur plusieurs jeux de données via un pool de processus partagé.
+
+    Un jeu de données en erreur n'interrompt pas les autres : son résultat contient
+    la clé 'error' au lieu de 'mentions'.
+
+    Args:
+        data_dirs (List[str]): Dossiers racines des jeux de données.
+        max_workers (Optional[int]): Nombre de processus. Par défaut, un par cœur (au plus un par jeu de données).
+
+    Returns:
+        List[Dict[str, Any]]: Résultat de chaque jeu de données, dans l'ordre de `data_dirs`.
+    """
+    if not data_dirs:
+        return []
+    max_workers = max_workers or min(len(data_dirs), os.cpu_count() or 1)
+    results: Dict[str, Dict[str, Any]] = {}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        submitted = {executor.submit(run_dataset, data_dir): data_dir for data_dir in data_dirs}
+        for future in as_completed(submitted):
+            data_dir = submitted[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # Échec du pool lui-même (processus interrompu) : aucune durée mesurée
+                result = {"data_dir": data_dir, "seconds": None, "error": repr(e)}
+            if "error" in result:
+                logger.error(f"Erreur lors du traitement du jeu de données {data_dir} : {result['error']}")
+            else:
+                logger.info(f"{data_dir} : {result['mentions']} mentions exportées en {result['seconds']:.2f} s.")
+            results[data_dir] = result
+
+    return [results[data_dir] for data_dir in data_dirs]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Point d'entrée du mode batch : `poetry run batch <dossier> [<dossier> ...] [--workers N]`.
+    """
+    parser = argparse.ArgumentParser(description="Exécute la pipeline ETL sur plusieurs jeux de données.")
+    parser.add_argument("data_dirs", nargs="+", help="Dossiers racines organisés comme data/ (Raw, Staging, Result).")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus du pool.")
+    args = parser.parse_args(argv)
+
+    logger.info(f"Début du traitement batch de {len(args.data_dirs)} jeu(x) de données...")
+    start = time.perf_counter()
+    results = run_batch(args.data_dirs, args.workers)
+    elapsed = time.perf_counter() - start
+
+    failures = [result for result in results if "error" in result]
+    logger.info(f"Traitement batch terminé en {elapsed:.2f} s "
+                f"({len(results) / elapsed:.2f} jeu(x) de données/s, {len(failures)} en erreur).")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
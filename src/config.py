@@ -1,24 +1,77 @@
 import os
+from types import SimpleNamespace
 
-RAW_DATA_DIR = os.path.join('data', 'Raw')
-STAGING_DATA_DIR = os.path.join('data', 'Staging')
-RESULT_DIR = os.path.join('data', 'Result')
-LINK_GRAPH_DIR = os.path.join(RESULT_DIR, 'link_graph')
-AD_HOC_DIR = os.path.join(RESULT_DIR, 'ad_hoc')
+DATA_DIR = 'data'
+
+
+def resolve_dataset_config(data_dir: str) -> SimpleNamespace:
+    """
+    Construit les chemins d'un jeu de données organisé comme le dossier `data/`
+    (sous-dossiers Raw, Staging et Result).
+
+    Args:
+        data_dir (str): Dossier racine du jeu de données.
+
+    Returns:
+        SimpleNamespace: Chemins exposés sous les mêmes noms que les constantes de ce module.
+    """
+    raw_data_dir = os.path.join(data_dir, 'Raw')
+    staging_data_dir = os.path.join(data_dir, 'Staging')
+    result_dir = os.path.join(data_dir, 'Result')
+    link_graph_dir = os.path.join(result_dir, 'link_graph')
+    ad_hoc_dir = os.path.join(result_dir, 'ad_hoc')
+    return SimpleNamespace(
+        RAW_DATA_DIR=raw_data_dir,
+        STAGING_DATA_DIR=staging_data_dir,
+        RESULT_DIR=result_dir,
+        LINK_GRAPH_DIR=link_graph_dir,
+        AD_HOC_DIR=ad_hoc_dir,
+        # Fichiers sources
+        SRC_DRUGS_FILE_PATH=os.path.join(raw_data_dir, 'Src_drugs.csv'),
+        SRC_PUBMED_FILE_PATH=os.path.join(raw_data_dir, 'Src_pubmed.csv'),
+        SRC_PUBMED_JSON_FILE_PATH=os.path.join(raw_data_dir, 'Src_pubmed.json'),
+        SRC_CLINICAL_TRIALS_FILE_PATH=os.path.join(raw_data_dir, 'Src_clinical_trials.csv'),
+        # Fichiers après nettoyage
+        DRUGS_FILE_PATH=os.path.join(staging_data_dir, 'drugs.csv'),
+        PUBMED_FILE_PATH=os.path.join(staging_data_dir, 'pubmed.csv'),
+        PUBMED_JSON_FILE_PATH=os.path.join(staging_data_dir, 'pubmed.json'),
+        CLINICAL_TRIALS_FILE_PATH=os.path.join(staging_data_dir, 'clinical_trials.csv'),
+        # Dossiers de sortie
+        OUTPUT_JSON_PATH=os.path.join(link_graph_dir, 'drug_mentions_graph.json'),
+        SQLITE_OUTPUT_PATH=os.path.join(link_graph_dir, 'drug_mentions.db'),
+        # Sorties des exécutions filtrées, distinctes des sorties complètes
+        FILTERED_OUTPUT_JSON_PATH=os.path.join(link_graph_dir, 'drug_mentions_graph_filtered.json'),
+        FILTERED_SQLITE_OUTPUT_PATH=os.path.join(link_graph_dir, 'drug_mentions_filtered.db'),
+        AD_HOC_OUTPUT_PATH=os.path.join(ad_hoc_dir, 'most_mentioned_journal.json'),
+    )
+
+
+_default = resolve_dataset_config(DATA_DIR)
+
+RAW_DATA_DIR = _default.RAW_DATA_DIR
+STAGING_DATA_DIR = _default.STAGING_DATA_DIR
+RESULT_DIR = _default.RESULT_DIR
+LINK_GRAPH_DIR = _default.LINK_GRAPH_DIR
+AD_HOC_DIR = _default.AD_HOC_DIR
 
 # Fichiers sources
-SRC_DRUGS_FILE_PATH = os.path.join(RAW_DATA_DIR, 'Src_drugs.csv')
-SRC_PUBMED_FILE_PATH = os.path.join(RAW_DATA_DIR, 'Src_pubmed.csv')
-SRC_PUBMED_JSON_FILE_PATH = os.path.join(RAW_DATA_DIR, 'Src_pubmed.json')
-SRC_CLINICAL_TRIALS_FILE_PATH = os.path.join(RAW_DATA_DIR, 'Src_clinical_trials.csv')
+SRC_DRUGS_FILE_PATH = _default.SRC_DRUGS_FILE_PATH
+SRC_PUBMED_FILE_PATH = _default.SRC_PUBMED_FILE_PATH
+SRC_PUBMED_JSON_FILE_PATH = _default.SRC_PUBMED_JSON_FILE_PATH
+SRC_CLINICAL_TRIALS_FILE_PATH = _default.SRC_CLINICAL_TRIALS_FILE_PATH
 
 # Fichiers après nettoyage
-DRUGS_FILE_PATH = os.path.join(STAGING_DATA_DIR, 'drugs.csv')
-PUBMED_FILE_PATH = os.path.join(STAGING_DATA_DIR, 'pubmed.csv')
-PUBMED_JSON_FILE_PATH = os.path.join(STAGING_DATA_DIR, 'pubmed.json')
-CLINICAL_TRIALS_FILE_PATH = os.path.join(STAGING_DATA_DIR, 'clinical_trials.csv')
+DRUGS_FILE_PATH = _default.DRUGS_FILE_PATH
+PUBMED_FILE_PATH = _default.PUBMED_FILE_PATH
+PUBMED_JSON_FILE_PATH = _default.PUBMED_JSON_FILE_PATH
+CLINICAL_TRIALS_FILE_PATH = _default.CLINICAL_TRIALS_FILE_PATH
 
 # Dossiers de sortie
-OUTPUT_JSON_PATH = os.path.join(LINK_GRAPH_DIR, 'drug_mentions_graph.json')
-AD_HOC_OUTPUT_PATH = os.path.join(AD_HOC_DIR, 'most_mentioned_journal.json')
+OUTPUT_JSON_PATH = _default.OUTPUT_JSON_PATH
+SQLITE_OUTPUT_PATH = _default.SQLITE_OUTPUT_PATH
+FILTERED_OUTPUT_JSON_PATH = _default.FILTERED_OUTPUT_JSON_PATH
+FILTERED_SQLITE_OUTPUT_PATH = _default.FILTERED_SQLITE_OUTPUT_PATH
+AD_HOC_OUTPUT_PATH = _default.AD_HOC_OUTPUT_PATH
 
+# Mode surveillance : intervalle (en secondes) entre deux scans du dossier Raw
+WATCH_POLL_INTERVAL = 0.2
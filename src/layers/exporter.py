@@ -1,27 +1,197 @@
 import json
 import os
-from typing import Any, Dict
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+import pandas as pd
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-def export_to_json(data: Dict[Any, Any], output_path: str) -> None:
+def export_to_json(data: Dict[Any, Any], output_path: str, allow_empty: bool = False) -> None:
     """
     Exporte un dictionnaire dans un fichier JSON formaté.
 
+    Le fichier est d'abord écrit dans un fichier temporaire du même dossier puis renommé,
+    de sorte qu'un lecteur ne voit jamais un fichier JSON partiellement écrit.
+
     Args:
         data (Dict[Any, Any]): Données à exporter.
         output_path (str): Chemin complet du fichier JSON de sortie.
+        allow_empty (bool): Si True, un dictionnaire vide est exporté (`{}`) au lieu d'être refusé.
     """
-    if not data:
+    if not data and not allow_empty:
         logger.error("Erreur : Aucun contenu à exporter dans le fichier JSON.")
         return
 
     try:
         # Assurer que le dossier de destination existe
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as file:
-            json.dump(data, file, indent=4, ensure_ascii=False)
+        tmp_path = f"{output_path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                json.dump(data, file, indent=4, ensure_ascii=False)
+            os.replace(tmp_path, output_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         logger.info(f"Exportation réussie du fichier JSON dans {output_path}.")
     except Exception as e:
         logger.error(f"Erreur lors de l'exportation du fichier JSON: {e}")
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE drugs (
+    drug TEXT PRIMARY KEY,
+    atccode TEXT
+);
+CREATE TABLE articles (
+    source TEXT NOT NULL,
+    id TEXT NOT NULL,
+    title TEXT,
+    journal TEXT,
+    date TEXT,
+    PRIMARY KEY (source, id)
+);
+CREATE TABLE mentions (
+    drug TEXT NOT NULL REFERENCES drugs (drug),
+    source TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    journal TEXT,
+    date TEXT
+);
+"""
+
+# Index créés après le chargement, plus rapide qu'une mise à jour à chaque insertion
+SQLITE_INDEXES = """
+CREATE INDEX idx_mentions_drug ON mentions (drug);
+CREATE INDEX idx_mentions_journal ON mentions (journal);
+CREATE INDEX idx_mentions_date ON mentions (date);
+"""
+
+
+def export_to_sqlite(
+    data: Dict[str, List[Dict[str, Any]]],
+    output_path: str,
+    drugs_df: Optional[pd.DataFrame] = None,
+    allow_empty: bool = False
+) -> bool:
+    """
+    Exporte le graphe de mentions dans une base SQLite sous forme de tables plates
+    `drugs`, `articles` et `mentions` (une ligne par couple médicament/article),
+    indexées sur le médicament, le journal et la date.
+
+    Les insertions sont faites par lots dans une seule transaction, dans une base temporaire
+    renommée ensuite, de sorte qu'un lecteur ne voit jamais une base partiellement écrite.
+
+    Args:
+        data (Dict[str, List[Dict[str, Any]]]): Graphe de mentions produit par `build_drug_mentions_graph`.
+        output_path (str): Chemin complet de la base SQLite de sortie.
+        drugs_df (Optional[pd.DataFrame]): Médicaments (colonnes 'drug' et 'atccode'). Par défaut,
+                                           les médicaments présents dans le graphe.
+        allow_empty (bool): Si True, un graphe vide produit une base aux tables vides au lieu d'être refusé.
+
+    Returns:
+        bool: True si la base a été exportée, False sinon.
+    """
+    if not data and not allow_empty:
+        logger.error("Erreur : Aucun contenu à exporter dans la base SQLite.")
+        return False
+
+    if drugs_df is not None and 'atccode' in drugs_df.columns:
+        drugs = list(zip(drugs_df['drug'].astype(str), drugs_df['atccode'].astype(str)))
+    else:
+        drugs = [(drug, None) for drug in data]
+    articles, mentions = _sqlite_rows(data)
+
+    try:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        tmp_path = f"{output_path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        try:
+            connection = sqlite3.connect(tmp_path)
+            try:
+                connection.executescript(SQLITE_SCHEMA)
+                with connection:
+                    connection.executemany("INSERT OR IGNORE INTO drugs VALUES (?, ?)", drugs)
+                    connection.executemany("INSERT OR IGNORE INTO articles VALUES (?, ?, ?, ?, ?)", articles)
+                    connection.executemany("INSERT INTO mentions VALUES (?, ?, ?, ?, ?)", mentions)
+                connection.executescript(SQLITE_INDEXES)
+            finally:
+                connection.close()
+            os.replace(tmp_path, output_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        logger.info(f"Exportation réussie de {len(mentions)} mentions dans la base SQLite {output_path}.")
+        return True
+    except Exception as e:
+        logger.error(f"Erreur lors de l'exportation de la base SQLite: {e}")
+        return False
+
+
+def update_sqlite_mentions(
+    data: Dict[str, List[Dict[str, Any]]],
+    output_path: str,
+    source: str,
+    replace: bool = False
+) -> bool:
+    """
+    Met à jour en place les lignes d'une source dans une base créée par `export_to_sqlite`,
+    sans reconstruire la base ni ses index.
+
+    Les suppressions et insertions sont faites dans une seule transaction : un lecteur voit
+    la base avant ou après la mise à jour, jamais entre les deux. La liste des médicaments
+    doit être inchangée ; sinon, la base doit être réexportée avec `export_to_sqlite`.
+
+    Args:
+        data (Dict[str, List[Dict[str, Any]]]): Mentions par médicament de la source `source`.
+        output_path (str): Chemin de la base SQLite existante.
+        source (str): Source concernée ('pubmed' ou 'clinical_trials').
+        replace (bool): Si True, les articles et mentions existants de la source sont remplacés
+                        par `data` ; sinon `data` ne contient que de nouvelles mentions, ajoutées.
+
+    Returns:
+        bool: True si la base a été mise à jour, False en cas d'erreur (base absente, etc.).
+    """
+    articles, mentions = _sqlite_rows(data)
+    try:
+        if not os.path.exists(output_path):
+            raise FileNotFoundError(f"Base SQLite introuvable : {output_path}")
+        connection = sqlite3.connect(output_path)
+        try:
+            with connection:
+                if replace:
+                    connection.execute("DELETE FROM mentions WHERE source = ?", (source,))
+                    connection.execute("DELETE FROM articles WHERE source = ?", (source,))
+                connection.executemany("INSERT OR IGNORE INTO articles VALUES (?, ?, ?, ?, ?)", articles)
+                connection.executemany("INSERT INTO mentions VALUES (?, ?, ?, ?, ?)", mentions)
+        finally:
+            connection.close()
+        logger.info(f"Mise à jour de {len(mentions)} mentions {source} dans la base SQLite {output_path}.")
+        return True
+    except Exception as e:
+        logger.error(f"Erreur lors de la mise à jour de la base SQLite: {e}")
+        return False
+
+
+def _sqlite_rows(data: Dict[str, List[Dict[str, Any]]]) -> Tuple[List[tuple], List[tuple]]:
+    """
+    Aplatit un graphe de mentions en lignes des tables `articles` et `mentions`.
+
+    Args:
+        data (Dict[str, List[Dict[str, Any]]]): Mentions par médicament.
+
+    Returns:
+        Tuple[List[tuple], List[tuple]]: Lignes de la table `articles` puis de la table `mentions`.
+    """
+    articles = []
+    mentions = []
+    for drug, drug_mentions in data.items():
+        for mention in drug_mentions:
+            article_id = str(mention.get('id'))
+            articles.append((mention.get('source'), article_id, mention.get('title'), mention.get('journal'), mention.get('date')))
+            mentions.append((drug, mention.get('source'), article_id, mention.get('journal'), mention.get('date')))
+    return articles, mentions
@@ -0,0 +1,123 @@
+import pandas as pd
+from dataclasses import dataclass
+from datetime import datetime
+from typing import FrozenSet, Optional
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SOURCES = ('pubmed', 'clinical_trials')
+
+
+@dataclass(frozen=True)
+class MentionFilter:
+    """
+    Restriction des articles pris en compte dans le graphe de mentions.
+
+    Attributes:
+        date_from (Optional[str]): Date minimale incluse, au format 'YYYY-MM-DD'.
+        date_to (Optional[str]): Date maximale incluse, au format 'YYYY-MM-DD'.
+        journals (Optional[FrozenSet[str]]): Journaux retenus. Tous si None.
+        sources (Optional[FrozenSet[str]]): Sources retenues ('pubmed', 'clinical_trials'). Toutes si None.
+    """
+    date_from: Optional[str] = None
+    date_to: Optional[str] = None
+    journals: Optional[FrozenSet[str]] = None
+    sources: Optional[FrozenSet[str]] = None
+
+    def __post_init__(self) -> None:
+        # Accepte toute collection pour les journaux et les sources, mais pas une chaîne seule
+        # (frozenset('Journal A') donnerait l'ensemble de ses caractères)
+        for name in ('journals', 'sources'):
+            value = getattr(self, name)
+            if isinstance(value, str):
+                raise TypeError(f"{name} doit être une collection de chaînes, pas une chaîne : {value!r}")
+            if value is not None and not isinstance(value, frozenset):
+                object.__setattr__(self, name, frozenset(value))
+        # Normalise les dates (ex: '2020-1-1' -> '2020-01-01') pour la comparaison de chaînes
+        for name in ('date_from', 'date_to'):
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, name, datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d"))
+        if self.date_from is not None and self.date_to is not None and self.date_from > self.date_to:
+            raise ValueError(f"La date minimale {self.date_from} est postérieure à la date maximale {self.date_to}.")
+        if self.sources is not None:
+            unknown = set(self.sources) - set(SOURCES)
+            if unknown:
+                raise ValueError(f"Sources inconnues : {sorted(unknown)}")
+
+    def is_active(self) -> bool:
+        """
+        Indique si le filtre restreint effectivement les articles.
+        """
+        return any(value is not None for value in (self.date_from, self.date_to, self.journals, self.sources))
+
+    def has_date_range(self) -> bool:
+        """
+        Indique si le filtre porte sur les dates.
+        """
+        return self.date_from is not None or self.date_to is not None
+
+    def includes_source(self, source: str) -> bool:
+        """
+        Indique si la source donnée ('pubmed' ou 'clinical_trials') est retenue.
+        """
+        return self.sources is None or source in self.sources
+
+    def filter_journals(self, df: pd.DataFrame, journal_column_name: str = 'journal') -> pd.DataFrame:
+        """
+        Conserve les lignes dont le journal fait partie des journaux retenus.
+
+        Args:
+            df (pd.DataFrame): DataFrame à filtrer.
+            journal_column_name (str): Nom de la colonne de journal.
+
+        Returns:
+            pd.DataFrame: DataFrame filtré.
+        """
+        if self.journals is None:
+            return df
+        if journal_column_name not in df.columns:
+            logger.warning(f"La colonne {journal_column_name} n'existe pas dans le DataFrame : aucune ligne retenue.")
+            return df.iloc[0:0]
+        return df[df[journal_column_name].isin(self.journals)]
+
+    def filter_dates(self, df: pd.DataFrame, date_column_name: str = 'date') -> pd.DataFrame:
+        """
+        Conserve les lignes dont la date, déjà au format 'YYYY-MM-DD', est dans l'intervalle.
+        Les lignes sans date (ou un DataFrame sans colonne de dates) sont écartées dès qu'un
+        intervalle est défini.
+
+        Args:
+            df (pd.DataFrame): DataFrame à filtrer.
+            date_column_name (str): Nom de la colonne de dates standardisées.
+
+        Returns:
+            pd.DataFrame: DataFrame filtré.
+        """
+        if not self.has_date_range():
+            return df
+        if date_column_name not in df.columns:
+            logger.warning(f"La colonne {date_column_name} n'existe pas dans le DataFrame : aucune ligne retenue.")
+            return df.iloc[0:0]
+        dates = df[date_column_name].fillna('').astype(str)
+        mask = dates != ''
+        if self.date_from is not None:
+            mask &= dates >= self.date_from
+        if self.date_to is not None:
+            mask &= dates <= self.date_to
+        return df[mask]
+
+    def apply(self, df: pd.DataFrame, date_column_name: str = 'date', journal_column_name: str = 'journal') -> pd.DataFrame:
+        """
+        Applique les filtres de journal puis de date à un DataFrame d'articles nettoyé.
+
+        Args:
+            df (pd.DataFrame): DataFrame d'articles avec des dates au format 'YYYY-MM-DD'.
+            date_column_name (str): Nom de la colonne de dates.
+            journal_column_name (str): Nom de la colonne de journal.
+
+        Returns:
+            pd.DataFrame: DataFrame filtré.
+        """
+        return self.filter_dates(self.filter_journals(df, journal_column_name), date_column_name)
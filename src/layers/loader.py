@@ -1,8 +1,19 @@
 import pandas as pd
 import json
+from typing import Callable, Optional
 
-def load_csv(file_path: str) -> pd.DataFrame:
-    return pd.read_csv(file_path)
+def load_csv(
+    file_path: str,
+    row_filter: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    chunksize: int = 100_000
+) -> pd.DataFrame:
+    if row_filter is None:
+        return pd.read_csv(file_path)
+    # Lecture par blocs : seules les lignes retenues par row_filter sont conservées en mémoire
+    chunks = [row_filter(chunk) for chunk in pd.read_csv(file_path, chunksize=chunksize)]
+    if not chunks:
+        return pd.read_csv(file_path, nrows=0)
+    return pd.concat(chunks, ignore_index=True)
 
 def load_json(file_path: str) -> pd.DataFrame:
     with open(file_path, 'r') as file:
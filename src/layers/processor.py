@@ -1,14 +1,101 @@
 import pandas as pd
 import re
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Pattern, Tuple
+from src.layers.filter import MentionFilter
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+DrugMatchers = Tuple[Tuple[str, Pattern[str]], ...]
+
+
+def compile_drug_matchers(drugs_df: pd.DataFrame) -> DrugMatchers:
+    """
+    Compile une expression régulière par médicament présent dans `drugs_df`.
+
+    Les doublons de noms sont ignorés afin que chaque médicament ne soit recherché qu'une fois.
+    Les patterns sont mis en cache par liste de médicaments : deux jeux de données partageant
+    la même liste réutilisent les mêmes patterns compilés dans un même processus.
+
+    Args:
+        drugs_df (pd.DataFrame): DataFrame contenant une colonne 'drug'.
+
+    Returns:
+        DrugMatchers: Couples (nom du médicament, pattern compilé), dans l'ordre de `drugs_df`.
+    """
+    return _compile_drug_matchers(tuple(drugs_df['drug'].astype(str).tolist()))
+
+
+@lru_cache(maxsize=32)
+def _compile_drug_matchers(drugs: Tuple[str, ...]) -> DrugMatchers:
+    matchers: List[Tuple[str, Pattern[str]]] = []
+    seen = set()
+    for drug in drugs:
+        if drug in seen:
+            continue
+        seen.add(drug)
+        # Utilisation de re.escape pour éviter que des caractères spéciaux dans le nom du médicament ne perturbent le pattern.
+        matchers.append((drug, re.compile(rf'\b{re.escape(drug)}\b', re.IGNORECASE)))
+    # Tuple immuable : le résultat en cache est partagé entre tous les appelants
+    return tuple(matchers)
+
+
+def find_drug_mentions(
+    matchers: DrugMatchers,
+    articles_df: pd.DataFrame,
+    title_column_name: str,
+    source: str
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Recherche les mentions de chaque médicament dans les titres d'un DataFrame d'articles.
+
+    Args:
+        matchers (DrugMatchers): Patterns compilés par `compile_drug_matchers`.
+        articles_df (pd.DataFrame): DataFrame contenant les colonnes `title_column_name`, 'id', 'journal' et 'date'.
+        title_column_name (str): Nom de la colonne de titre dans laquelle chercher.
+        source (str): Nom de la source reporté dans chaque mention (ex: 'pubmed').
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Mentions par médicament, uniquement pour les médicaments trouvés.
+    """
+    mentions: Dict[str, List[Dict[str, Any]]] = {}
+    if articles_df.empty:
+        return mentions
+
+    def column(name: str, default: Any) -> List[Any]:
+        if name in articles_df.columns:
+            return articles_df[name].tolist()
+        return [default] * len(articles_df)
+
+    rows = zip(
+        column(title_column_name, ''),
+        column('id', None),
+        column('journal', ''),
+        column('date', '')
+    )
+    for title, article_id, journal, date in rows:
+        if not isinstance(title, str):
+            continue
+        date = date if pd.notna(date) else ""
+        for drug, pattern in matchers:
+            if pattern.search(title):
+                mentions.setdefault(drug, []).append({
+                    'source': source,
+                    'id': article_id,
+                    'title': title,
+                    'journal': journal,
+                    'date': date
+                })
+    return mentions
+
+
 def build_drug_mentions_graph(
-    drugs_df: pd.DataFrame, 
-    pubmed_df: pd.DataFrame, 
-    clinical_trials_df: pd.DataFrame
+    drugs_df: pd.DataFrame,
+    pubmed_df: pd.DataFrame,
+    clinical_trials_df: pd.DataFrame,
+    matchers: Optional[DrugMatchers] = None,
+    mention_filter: Optional[MentionFilter] = None
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
     Construit un graphe de mentions des médicaments à partir des DataFrames fournis.
@@ -22,48 +109,48 @@ def build_drug_mentions_graph(
         drugs_df (pd.DataFrame): DataFrame contenant une colonne 'drug'.
         pubmed_df (pd.DataFrame): DataFrame contenant les articles PubMed avec les colonnes 'title', 'id', 'journal' et 'date'.
         clinical_trials_df (pd.DataFrame): DataFrame contenant les essais cliniques avec les colonnes 'scientific_title', 'id', 'journal' et 'date'.
+        matchers (Optional[DrugMatchers]): Patterns déjà compilés pour `drugs_df`. Compilés à la volée si absents.
+        mention_filter (Optional[MentionFilter]): Restreint les articles recherchés (dates, journaux, sources).
 
     Returns:
         Dict[str, List[Dict[str, Any]]]: Dictionnaire où chaque clé est le nom d'un médicament et la valeur est
                                           une liste de dictionnaires décrivant les mentions (source, id, title, journal, date).
     """
-    graph_data: Dict[str, List[Dict[str, Any]]] = {}
+    if matchers is None:
+        matchers = compile_drug_matchers(drugs_df)
 
-    for _, drug_row in drugs_df.iterrows():
-        drug: str = str(drug_row['drug'])
-        mentions: List[Dict[str, Any]] = []
-        # Utilisation de re.escape pour éviter que des caractères spéciaux dans le nom du médicament ne perturbent le pattern.
-        drug_pattern = rf'\b{re.escape(drug)}\b'
-
-        # Recherche dans les articles PubMed
-        for _, row in pubmed_df.iterrows():
-            title = row.get('title', '')
-            date = row.get('date', '')
-            date = date if pd.notna(date) else ""
-            if isinstance(title, str) and re.search(drug_pattern, title, re.IGNORECASE):
-                mentions.append({
-                    'source': 'pubmed',
-                    'id': row.get('id'),
-                    'title': title,
-                    'journal': row.get('journal', ''),
-                    'date': date
-                })
+    mentions_by_source: List[Dict[str, List[Dict[str, Any]]]] = []
+    for source, articles_df, title_column_name in (
+        ('pubmed', pubmed_df, 'title'),
+        ('clinical_trials', clinical_trials_df, 'scientific_title')
+    ):
+        if mention_filter is not None:
+            if not mention_filter.includes_source(source):
+                continue
+            articles_df = mention_filter.apply(articles_df)
+        mentions_by_source.append(find_drug_mentions(matchers, articles_df, title_column_name, source))
+    return merge_drug_mentions(matchers, *mentions_by_source)
 
-        # Recherche dans les essais cliniques
-        for _, row in clinical_trials_df.iterrows():
-            scientific_title = row.get('scientific_title', '')
-            date = row.get('date', '')
-            date = date if pd.notna(date) else ""
-            if isinstance(scientific_title, str) and re.search(drug_pattern, scientific_title, re.IGNORECASE):
-                mentions.append({
-                    'source': 'clinical_trials',
-                    'id': row.get('id'),
-                    'title': scientific_title,
-                    'journal': row.get('journal', ''),
-                    'date': date
-                })
 
+def merge_drug_mentions(
+    matchers: DrugMatchers,
+    *mentions_by_source: Dict[str, List[Dict[str, Any]]]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Assemble les mentions de plusieurs sources en un graphe ordonné comme la liste des médicaments.
+
+    Args:
+        matchers (DrugMatchers): Patterns compilés, utilisés pour l'ordre des médicaments.
+        *mentions_by_source: Mentions par médicament pour chaque source, dans l'ordre de sortie voulu.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Graphe de mentions ne contenant que les médicaments mentionnés.
+    """
+    graph_data: Dict[str, List[Dict[str, Any]]] = {}
+    for drug, _ in matchers:
+        mentions: List[Dict[str, Any]] = []
+        for source_mentions in mentions_by_source:
+            mentions.extend(source_mentions.get(drug, []))
         if mentions:
             graph_data[drug] = mentions
-
     return graph_data
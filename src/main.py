@@ -1,6 +1,9 @@
+import argparse
 import os
 import sys
-from typing import Tuple
+from functools import partial
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Set, Tuple
 import pandas as pd
 import json
 
@@ -14,13 +17,108 @@ from src.layers.transformer import (
     remove_rows_with_empty_titles_or_journals,
     remove_duplicate_ids_and_reindex
 )
+from src.layers.filter import MentionFilter, SOURCES
 from src.layers.processor import build_drug_mentions_graph
-from src.layers.exporter import export_to_json
+from src.layers.exporter import export_to_json, export_to_sqlite
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-def load_and_transform() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+def load_pubmed_json(file_path: str) -> pd.DataFrame:
+    """
+    Charge un fichier JSON PubMed, en corrigeant le texte brut si le JSON est invalide.
+
+    Args:
+        file_path (str): Chemin du fichier JSON PubMed.
+
+    Returns:
+        pd.DataFrame: DataFrame des articles PubMed du fichier.
+    """
+    try:
+        # Tente de charger le JSON directement depuis le fichier source
+        return load_json(file_path)
+    except json.JSONDecodeError as e:
+        logger.info(f"Erreur JSON détectée : {e}. Tentative de nettoyage en mode texte...")
+        pubmed_text: str = load_text(file_path)
+        return correct_json_text(pubmed_text)
+
+
+def transform_drugs(drugs_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Nettoie le DataFrame des médicaments (IDs en texte, sans doublons).
+
+    Args:
+        drugs_df (pd.DataFrame): DataFrame brut des médicaments.
+
+    Returns:
+        pd.DataFrame: DataFrame des médicaments nettoyé.
+    """
+    drugs_df = convert_id_to_string(drugs_df, 'atccode')
+    return remove_duplicate_ids_and_reindex(drugs_df, 'atccode')
+
+
+def transform_articles(articles_df: pd.DataFrame, title_column_name: str) -> pd.DataFrame:
+    """
+    Nettoie un DataFrame d'articles (PubMed ou essais cliniques) : dates standardisées,
+    titres nettoyés, lignes sans titre ou journal supprimées et IDs dédoublonnés.
+
+    Args:
+        articles_df (pd.DataFrame): DataFrame brut des articles.
+        title_column_name (str): Nom de la colonne de titre ('title' ou 'scientific_title').
+
+    Returns:
+        pd.DataFrame: DataFrame des articles nettoyé.
+    """
+    articles_df = standardize_date_format(articles_df, 'date')
+    articles_df = sanitize_title_text(articles_df, title_column_name)
+    articles_df = remove_rows_with_empty_titles_or_journals(articles_df, title_column_name, 'journal')
+    return remove_duplicate_ids_and_reindex(articles_df, 'id')
+
+
+def prefilter_articles(
+    articles_df: pd.DataFrame,
+    mention_filter: MentionFilter,
+    title_column_name: str,
+    seen_ids: Set[Any]
+) -> pd.DataFrame:
+    """
+    Écarte les articles bruts hors du filtre avant le nettoyage des titres et la recherche.
+
+    Pour que le résultat filtré corresponde exactement à la construction complète restreinte
+    au filtre, les lignes sans titre ou journal sont d'abord écartées, puis seule la première
+    occurrence de chaque ID est conservée, en tenant compte des IDs des blocs précédents
+    (`seen_ids`). Le filtre est appliqué ensuite : le journal est comparé sur sa valeur brute,
+    la date après standardisation au format 'YYYY-MM-DD'.
+
+    Args:
+        articles_df (pd.DataFrame): DataFrame brut des articles (ou bloc d'un fichier CSV).
+        mention_filter (MentionFilter): Filtre à appliquer.
+        title_column_name (str): Nom de la colonne de titre ('title' ou 'scientific_title').
+        seen_ids (Set[Any]): IDs déjà rencontrés dans la même source, complété par cette fonction.
+
+    Returns:
+        pd.DataFrame: DataFrame des articles retenus.
+    """
+    if title_column_name in articles_df.columns and 'journal' in articles_df.columns:
+        # Un titre non textuel devient vide au nettoyage et serait écarté par remove_rows_with_empty_titles_or_journals
+        has_title = articles_df[title_column_name].map(lambda title: isinstance(title, str)).astype(bool)
+        articles_df = articles_df[has_title & articles_df['journal'].notna()]
+    if 'id' in articles_df.columns:
+        first_occurrence = ~articles_df['id'].duplicated() & ~articles_df['id'].isin(seen_ids)
+        seen_ids.update(articles_df['id'].tolist())
+        articles_df = articles_df[first_occurrence]
+
+    articles_df = mention_filter.filter_journals(articles_df)
+    if mention_filter.has_date_range():
+        articles_df = standardize_date_format(articles_df.copy(), 'date')
+        articles_df = mention_filter.filter_dates(articles_df)
+    return articles_df
+
+
+def load_and_transform(
+    cfg: Optional[SimpleNamespace] = None,
+    mention_filter: Optional[MentionFilter] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Charge et nettoie les données sources.
     
@@ -30,80 +128,125 @@ def load_and_transform() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
       3. Combine les données PubMed issues du CSV et du JSON.
       4. Applique les opérations de transformation et de nettoyage.
       5. Sauvegarde les fichiers nettoyés dans le dossier de préparation.
+
+    Lorsqu'un filtre est actif, les sources exclues ne sont pas lues, les autres articles sont
+    filtrés dès la lecture (par blocs pour les CSV) et le dossier de préparation n'est pas
+    mis à jour, puisqu'il ne contiendrait qu'une partie des données.
+
+    Args:
+        cfg (Optional[SimpleNamespace]): Chemins du jeu de données (voir `config.resolve_dataset_config`).
+                                         Par défaut, les chemins du module `config`.
+        mention_filter (Optional[MentionFilter]): Restreint les articles chargés (dates, journaux, sources).
     
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: (drugs_df, pubmed_df, clinical_trials_df)
     """
+    cfg = cfg or config
+    mention_filter = mention_filter or MentionFilter()
+    pubmed_filter = clinical_trials_filter = None
+    if mention_filter.is_active():
+        # Un ensemble d'IDs par source : le CSV et le JSON PubMed sont dédoublonnés ensemble, dans cet ordre
+        pubmed_filter = partial(prefilter_articles, mention_filter=mention_filter, title_column_name='title', seen_ids=set())
+        clinical_trials_filter = partial(
+            prefilter_articles, mention_filter=mention_filter, title_column_name='scientific_title', seen_ids=set()
+        )
+    pubmed_df = pd.DataFrame(columns=['id', 'title', 'date', 'journal'])
+    clinical_trials_df = pd.DataFrame(columns=['id', 'scientific_title', 'date', 'journal'])
+
     # Traitement du JSON PubMed
-    try:
-        # Tente de charger le JSON nettoyé depuis le fichier source
-        pubmed_json_df: pd.DataFrame = load_json(config.SRC_PUBMED_JSON_FILE_PATH)
-    except json.JSONDecodeError as e:
-        logger.info(f"Erreur JSON détectée : {e}. Tentative de nettoyage en mode texte...")
+    if mention_filter.includes_source('pubmed'):
         try:
-            pubmed_text: str = load_text(config.SRC_PUBMED_JSON_FILE_PATH)
-            pubmed_json_df = correct_json_text(pubmed_text)
-        except Exception as e2:
-            logger.error(f"Erreur lors de la correction du JSON PubMed: {e2}")
+            pubmed_json_df: pd.DataFrame = load_pubmed_json(cfg.SRC_PUBMED_JSON_FILE_PATH)
+        except Exception as e:
+            logger.error(f"Erreur lors du chargement du JSON PubMed: {e}")
             sys.exit(1)
-    except Exception as e:
-        logger.error(f"Erreur lors du chargement du JSON PubMed: {e}")
-        sys.exit(1)
 
     # Chargement des fichiers CSV
     try:
         logger.info("Chargement des fichiers CSV sources...")
-        drugs_df: pd.DataFrame = load_csv(config.SRC_DRUGS_FILE_PATH)
-        pubmed_csv_df: pd.DataFrame = load_csv(config.SRC_PUBMED_FILE_PATH)
-        clinical_trials_df: pd.DataFrame = load_csv(config.SRC_CLINICAL_TRIALS_FILE_PATH)
+        drugs_df: pd.DataFrame = load_csv(cfg.SRC_DRUGS_FILE_PATH)
+        if mention_filter.includes_source('pubmed'):
+            pubmed_csv_df: pd.DataFrame = load_csv(cfg.SRC_PUBMED_FILE_PATH, pubmed_filter)
+            if pubmed_filter is not None:
+                # Filtré après le CSV, qui le précède dans la combinaison PubMed
+                pubmed_json_df = pubmed_filter(pubmed_json_df)
+        if mention_filter.includes_source('clinical_trials'):
+            clinical_trials_df = load_csv(cfg.SRC_CLINICAL_TRIALS_FILE_PATH, clinical_trials_filter)
     except Exception as e:
         logger.error(f"Erreur lors du chargement des fichiers CSV: {e}")
         sys.exit(1)
 
     # Combinaison des données PubMed
-    try:
-        logger.info("Combinaison des données PubMed issues du CSV et du JSON...")
-        pubmed_df: pd.DataFrame = pd.concat([pubmed_csv_df, pubmed_json_df], ignore_index=True)
-    except Exception as e:
-        logger.error(f"Erreur lors de la combinaison des données PubMed: {e}")
-        sys.exit(1)
+    if mention_filter.includes_source('pubmed'):
+        try:
+            logger.info("Combinaison des données PubMed issues du CSV et du JSON...")
+            pubmed_df = pd.concat([pubmed_csv_df, pubmed_json_df], ignore_index=True)
+        except Exception as e:
+            logger.error(f"Erreur lors de la combinaison des données PubMed: {e}")
+            sys.exit(1)
 
     # Transformation et nettoyage
     try:
         logger.info("Transformation et nettoyage des données...")
-        # Traitement du fichier drugs
-        drugs_df = convert_id_to_string(drugs_df, 'atccode')
-        drugs_df = remove_duplicate_ids_and_reindex(drugs_df, 'atccode')
-        drugs_df.to_csv(config.DRUGS_FILE_PATH, index=False)
-        
-        # Standardisation des dates
-        pubmed_df = standardize_date_format(pubmed_df, 'date')
-        clinical_trials_df = standardize_date_format(clinical_trials_df, 'date')
-        
-        # Nettoyage des titres et journaux
-        pubmed_df = sanitize_title_text(pubmed_df, 'title')
-        clinical_trials_df = sanitize_title_text(clinical_trials_df, 'scientific_title')
-        pubmed_df = remove_rows_with_empty_titles_or_journals(pubmed_df, 'title', 'journal')
-        clinical_trials_df = remove_rows_with_empty_titles_or_journals(clinical_trials_df, 'scientific_title', 'journal')
-        
-        # Suppression des doublons sur les IDs
-        pubmed_df = remove_duplicate_ids_and_reindex(pubmed_df, 'id')
-        clinical_trials_df = remove_duplicate_ids_and_reindex(clinical_trials_df, 'id')
-        
+        drugs_df = transform_drugs(drugs_df)
+        if mention_filter.includes_source('pubmed'):
+            pubmed_df = transform_articles(pubmed_df, 'title')
+        if mention_filter.includes_source('clinical_trials'):
+            clinical_trials_df = transform_articles(clinical_trials_df, 'scientific_title')
+
         # Sauvegarde des fichiers nettoyés
-        pubmed_df.to_csv(config.PUBMED_FILE_PATH, index=False)
-        clinical_trials_df.to_csv(config.CLINICAL_TRIALS_FILE_PATH, index=False)
+        if mention_filter.is_active():
+            logger.info("Filtre actif : les fichiers du dossier de préparation ne sont pas mis à jour.")
+        else:
+            os.makedirs(cfg.STAGING_DATA_DIR, exist_ok=True)
+            drugs_df.to_csv(cfg.DRUGS_FILE_PATH, index=False)
+            pubmed_df.to_csv(cfg.PUBMED_FILE_PATH, index=False)
+            clinical_trials_df.to_csv(cfg.CLINICAL_TRIALS_FILE_PATH, index=False)
     except Exception as e:
         logger.error(f"Erreur lors du nettoyage des données CSV: {e}")
         sys.exit(1)
     
     return drugs_df, pubmed_df, clinical_trials_df
 
-def build_and_export_graph() -> None:
+def build_and_export_graph(
+    cfg: Optional[SimpleNamespace] = None,
+    mention_filter: Optional[MentionFilter] = None,
+    output_path: Optional[str] = None
+) -> Dict[str, List[Dict[str, Any]]]:
     """
-    Construit le graphe de mentions des médicaments et exporte le résultat en JSON.
+    Construit le graphe de mentions des médicaments et exporte le résultat en JSON,
+    ainsi qu'en tables plates dans une base SQLite pour les requêtes d'analyse.
+
+    Une exécution filtrée n'écrase pas les sorties complètes : elle écrit par défaut dans
+    FILTERED_OUTPUT_JSON_PATH et FILTERED_SQLITE_OUTPUT_PATH, et un filtre qui ne retient
+    aucune mention produit un graphe vide plutôt qu'une erreur.
+
+    Args:
+        cfg (Optional[SimpleNamespace]): Chemins du jeu de données. Par défaut, les chemins du module `config`.
+        mention_filter (Optional[MentionFilter]): Restreint les articles pris en compte, dès leur chargement.
+        output_path (Optional[str]): Chemin du fichier JSON de sortie. La base SQLite est écrite à côté,
+                                     avec l'extension '.db'. Par défaut, selon que le filtre est actif ou non.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Le graphe de mentions exporté.
     """
-    drugs_df, pubmed_df, clinical_trials_df = load_and_transform()
+    cfg = cfg or config
+    filtered = mention_filter is not None and mention_filter.is_active()
+    if output_path and output_path.lower().endswith('.db'):
+        # La base SQLite, écrite à côté en '.db', remplacerait le graphe JSON
+        logger.error(f"Le fichier de sortie {output_path} doit être un fichier JSON, pas une base '.db'.")
+        sys.exit(1)
+    if output_path:
+        json_output_path = output_path
+        sqlite_output_path = f"{os.path.splitext(output_path)[0]}.db"
+    elif filtered:
+        json_output_path = cfg.FILTERED_OUTPUT_JSON_PATH
+        sqlite_output_path = cfg.FILTERED_SQLITE_OUTPUT_PATH
+    else:
+        json_output_path = cfg.OUTPUT_JSON_PATH
+        sqlite_output_path = cfg.SQLITE_OUTPUT_PATH
+
+    drugs_df, pubmed_df, clinical_trials_df = load_and_transform(cfg, mention_filter)
     
     logger.info("Construction du graphe de mentions de médicaments...")
     try:
@@ -113,23 +256,63 @@ def build_and_export_graph() -> None:
         sys.exit(1)
     
     if not graph_data:
-        logger.error("Aucun contenu dans le graphe à exporter.")
-        sys.exit(1)
+        if not filtered:
+            logger.error("Aucun contenu dans le graphe à exporter.")
+            sys.exit(1)
+        logger.warning("Aucune mention ne correspond au filtre : export d'un graphe vide.")
     
     try:
-        export_to_json(graph_data, config.OUTPUT_JSON_PATH)
-        logger.info(f"Graph exporté avec succès dans {config.OUTPUT_JSON_PATH}")
+        export_to_json(graph_data, json_output_path, allow_empty=filtered)
+        logger.info(f"Graph exporté avec succès dans {json_output_path}")
+        sqlite_exported = export_to_sqlite(graph_data, sqlite_output_path, drugs_df, allow_empty=filtered)
     except Exception as e:
         logger.error(f"Erreur lors de l'exportation du graphe: {e}")
         sys.exit(1)
+    if not sqlite_exported:
+        logger.error(f"Erreur lors de l'exportation du graphe dans la base SQLite {sqlite_output_path}.")
+        sys.exit(1)
+
+    return graph_data
+
 
+def parse_arguments(argv: Optional[List[str]] = None) -> Tuple[MentionFilter, Optional[str]]:
+    """
+    Construit le filtre de mentions et le chemin de sortie à partir de la ligne de commande.
+
+    Args:
+        argv (Optional[List[str]]): Arguments à analyser. Par défaut, ceux du processus.
+
+    Returns:
+        Tuple[MentionFilter, Optional[str]]: Filtre (inactif si aucun filtre n'est fourni) et
+                                             chemin du fichier JSON de sortie (None par défaut).
+    """
+    parser = argparse.ArgumentParser(description="Construit le graphe de mentions des médicaments.")
+    parser.add_argument("--date-from", help="Date minimale incluse (YYYY-MM-DD).")
+    parser.add_argument("--date-to", help="Date maximale incluse (YYYY-MM-DD).")
+    parser.add_argument("--journal", action="append", dest="journals", help="Journal retenu (option répétable).")
+    parser.add_argument("--source", action="append", dest="sources", choices=SOURCES, help="Source retenue (option répétable).")
+    parser.add_argument("--output", help="Fichier JSON de sortie (la base SQLite est écrite à côté, en .db).")
+    args = parser.parse_args(argv)
+    if args.output and args.output.lower().endswith('.db'):
+        parser.error("--output doit être un fichier JSON : la base SQLite est écrite à côté, en .db.")
+    try:
+        mention_filter = MentionFilter(args.date_from, args.date_to, args.journals, args.sources)
+    except ValueError as e:
+        parser.error(str(e))
+    return mention_filter, args.output
 
-def main() -> None:
+
+def main(argv: Optional[List[str]] = None) -> None:
     """
     Point d'entrée de la pipeline ETL.
+
+    Args:
+        argv (Optional[List[str]]): Filtres optionnels (--date-from, --date-to, --journal, --source)
+                                    et chemin de sortie (--output). Par défaut, les arguments du processus.
     """
+    mention_filter, output_path = parse_arguments(argv)
     logger.info("Début de la pipeline ETL...")
-    build_and_export_graph()
+    build_and_export_graph(mention_filter=mention_filter, output_path=output_path)
     logger.info("Pipeline ETL terminée avec succès.")
 
 if __name__ == "__main__":
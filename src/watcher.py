@@ -0,0 +1,320 @@
+import os
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple, Any
+import pandas as pd
+
+from src import config
+from src.layers.loader import load_csv
+from src.layers.processor import (
+    DrugMatchers,
+    compile_drug_matchers,
+    find_drug_mentions,
+    merge_drug_mentions
+)
+from src.layers.transformer import remove_duplicate_ids_and_reindex
+from src.layers.exporter import export_to_json, export_to_sqlite, update_sqlite_mentions
+from src.main import load_pubmed_json, transform_drugs, transform_articles
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Signature d'un fichier : (date de modification en ns, taille en octets)
+FileSignature = Tuple[int, int]
+
+# Colonne de titre de chaque source d'articles, dans l'ordre de sortie du graphe
+ARTICLE_SOURCES: Dict[str, str] = {
+    'pubmed': 'title',
+    'clinical_trials': 'scientific_title'
+}
+
+# Colonnes sans lesquelles un fichier du dossier Raw est rejeté
+REQUIRED_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    'drugs': ('atccode', 'drug'),
+    'pubmed': ('id', 'title', 'date', 'journal'),
+    'clinical_trials': ('id', 'scientific_title', 'date', 'journal')
+}
+
+
+def classify_raw_file(file_name: str) -> Optional[str]:
+    """
+    Détermine le type de données d'un fichier du dossier Raw à partir de son nom.
+
+    Args:
+        file_name (str): Nom du fichier (ex: 'Src_pubmed_2020_02.csv').
+
+    Returns:
+        Optional[str]: 'drugs', 'pubmed', 'clinical_trials' ou None si le fichier est ignoré.
+    """
+    name, extension = os.path.splitext(file_name.lower())
+    if name.startswith('.') or extension not in ('.csv', '.json'):
+        return None
+    for kind in ('clinical_trials', 'pubmed', 'drugs'):
+        if kind in name:
+            return kind
+    return None
+
+
+def load_raw_file(file_path: str, kind: str) -> pd.DataFrame:
+    """
+    Charge et nettoie un fichier du dossier Raw selon son type. Un fichier sans les colonnes
+    requises pour son type est rejeté (ValueError).
+
+    Args:
+        file_path (str): Chemin du fichier CSV ou JSON.
+        kind (str): Type de données retourné par `classify_raw_file`.
+
+    Returns:
+        pd.DataFrame: DataFrame nettoyé du fichier.
+    """
+    if file_path.lower().endswith('.json'):
+        df = load_pubmed_json(file_path)
+    else:
+        df = load_csv(file_path)
+    missing = [column for column in REQUIRED_COLUMNS[kind] if column not in df.columns]
+    if missing:
+        raise ValueError(f"Colonnes manquantes : {missing}")
+    if kind == 'drugs':
+        return transform_drugs(df)
+    return transform_articles(df, ARTICLE_SOURCES[kind])
+
+
+class MentionsWatcher:
+    """
+    Surveille le dossier Raw par scrutation et maintient en mémoire les données nettoyées,
+    les patterns compilés des médicaments et le graphe de mentions.
+
+    Un nouveau fichier d'articles n'est nettoyé et recherché que pour ses propres lignes ;
+    un fichier modifié ou supprimé reconstruit sa source depuis les fichiers déjà en mémoire,
+    et un changement de la liste des médicaments relance la recherche sur toutes les sources.
+    """
+
+    def __init__(self, cfg: Optional[SimpleNamespace] = None) -> None:
+        self.cfg = cfg or config
+        self.raw_dir: str = self.cfg.RAW_DATA_DIR
+        self.signatures: Dict[str, FileSignature] = {}
+        self.pending: Dict[str, FileSignature] = {}
+        self.file_frames: Dict[str, Dict[str, pd.DataFrame]] = {
+            kind: {} for kind in ('drugs', *ARTICLE_SOURCES)
+        }
+        self.frames: Dict[str, pd.DataFrame] = {
+            kind: pd.DataFrame() for kind in self.file_frames
+        }
+        self.matchers: DrugMatchers = ()
+        self.mentions: Dict[str, Dict[str, List[Dict[str, Any]]]] = {kind: {} for kind in ARTICLE_SOURCES}
+        self.graph: Dict[str, List[Dict[str, Any]]] = {}
+        # La base SQLite n'est réexportée entièrement qu'au démarrage ou si les médicaments changent
+        self.sqlite_synced: bool = False
+        # Colonnes des fichiers de préparation réécrits entièrement, auxquels les ajouts sont annexés
+        self.staged_columns: Dict[str, List[str]] = {}
+
+    def scan(self) -> Dict[str, FileSignature]:
+        """
+        Liste les fichiers reconnus du dossier Raw avec leur signature.
+
+        Returns:
+            Dict[str, FileSignature]: Signature de chaque fichier, par chemin, triés par nom.
+        """
+        signatures: Dict[str, FileSignature] = {}
+        with os.scandir(self.raw_dir) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.is_file() and classify_raw_file(entry.name):
+                    stat = entry.stat()
+                    signatures[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+
+    def start(self) -> None:
+        """
+        Charge l'ensemble du dossier Raw et publie le graphe initial.
+        """
+        self.apply_changes(self.scan(), [])
+
+    def poll(self) -> bool:
+        """
+        Scanne le dossier Raw et traite les fichiers ajoutés, modifiés ou supprimés.
+
+        Un fichier n'est traité que lorsque sa signature est identique sur deux scans
+        consécutifs, afin de ne pas lire un fichier en cours de copie.
+
+        Returns:
+            bool: True si le graphe a été republié.
+        """
+        current = self.scan()
+        ready: Dict[str, FileSignature] = {}
+        pending: Dict[str, FileSignature] = {}
+        for path, signature in current.items():
+            if self.signatures.get(path) == signature:
+                continue
+            if self.pending.get(path) == signature:
+                ready[path] = signature
+            else:
+                pending[path] = signature
+        self.pending = pending
+        removed = [path for path in self.signatures if path not in current]
+
+        if not ready and not removed:
+            return False
+        self.apply_changes(ready, removed)
+        return True
+
+    def apply_changes(self, changed: Dict[str, FileSignature], removed: List[str]) -> None:
+        """
+        Met à jour les données en mémoire pour les fichiers donnés puis republie le graphe.
+
+        Args:
+            changed (Dict[str, FileSignature]): Fichiers ajoutés ou modifiés, avec leur signature.
+            removed (List[str]): Fichiers supprimés du dossier Raw.
+        """
+        start = time.perf_counter()
+        rebuilt = set()
+        appended: Dict[str, List[pd.DataFrame]] = {kind: [] for kind in ARTICLE_SOURCES}
+
+        for path in removed:
+            kind = classify_raw_file(os.path.basename(path))
+            self.signatures.pop(path, None)
+            if kind and self.file_frames[kind].pop(path, None) is not None:
+                rebuilt.add(kind)
+
+        for path, signature in changed.items():
+            kind = classify_raw_file(os.path.basename(path))
+            self.signatures[path] = signature
+            try:
+                df = load_raw_file(path, kind)
+            except Exception as e:
+                logger.error(f"Erreur lors du traitement du fichier {path}: {e}")
+                continue
+            known = path in self.file_frames[kind]
+            self.file_frames[kind][path] = df
+            if known or kind == 'drugs':
+                rebuilt.add(kind)
+            else:
+                appended[kind].append(df)
+
+        drugs_changed = 'drugs' in rebuilt
+        if drugs_changed:
+            self.frames['drugs'] = self._combine('drugs')
+            self.matchers = compile_drug_matchers(self.frames['drugs']) if not self.frames['drugs'].empty else ()
+
+        # Mises à jour de la base SQLite par source : (mentions, remplacement complet de la source)
+        sqlite_updates: Dict[str, Tuple[Dict[str, List[Dict[str, Any]]], bool]] = {}
+        appended_rows: Dict[str, pd.DataFrame] = {}
+        for kind, title_column_name in ARTICLE_SOURCES.items():
+            if kind in rebuilt:
+                self.frames[kind] = self._combine(kind)
+                new_rows = self.frames[kind]
+                self.mentions[kind] = {}
+            elif appended[kind]:
+                new_rows = appended_rows[kind] = self._append(kind, appended[kind])
+            else:
+                new_rows = None
+
+            if drugs_changed:
+                self.mentions[kind] = find_drug_mentions(self.matchers, self.frames[kind], title_column_name, kind)
+            elif new_rows is not None:
+                new_mentions = find_drug_mentions(self.matchers, new_rows, title_column_name, kind)
+                for drug, mentions in new_mentions.items():
+                    self.mentions[kind].setdefault(drug, []).extend(mentions)
+                sqlite_updates[kind] = (self.mentions[kind], True) if kind in rebuilt else (new_mentions, False)
+
+        self.graph = merge_drug_mentions(self.matchers, *self.mentions.values())
+        # Un graphe vide (ex: fichier des médicaments supprimé) est publié tel quel
+        export_to_json(self.graph, self.cfg.OUTPUT_JSON_PATH, allow_empty=True)
+        self._publish_sqlite(drugs_changed, sqlite_updates)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"Graphe republié en {elapsed_ms:.1f} ms "
+                    f"({len(changed)} fichier(s) modifié(s), {len(removed)} supprimé(s)).")
+        # Le dossier de préparation n'est mis à jour qu'après la publication du graphe
+        self._save_staging(rebuilt, appended_rows)
+
+    def _publish_sqlite(
+        self,
+        drugs_changed: bool,
+        sqlite_updates: Dict[str, Tuple[Dict[str, List[Dict[str, Any]]], bool]]
+    ) -> None:
+        """
+        Met à jour la base SQLite : seules les lignes des sources modifiées sont remplacées ou
+        ajoutées, sauf au démarrage ou si les médicaments changent, où la base est réexportée.
+
+        Args:
+            drugs_changed (bool): True si la liste des médicaments a changé.
+            sqlite_updates: Mentions à écrire par source, avec l'indicateur de remplacement complet.
+        """
+        if self.sqlite_synced and not drugs_changed:
+            self.sqlite_synced = all(
+                update_sqlite_mentions(mentions, self.cfg.SQLITE_OUTPUT_PATH, kind, replace)
+                for kind, (mentions, replace) in sqlite_updates.items()
+            )
+            if self.sqlite_synced:
+                return
+        self.sqlite_synced = export_to_sqlite(self.graph, self.cfg.SQLITE_OUTPUT_PATH, self.frames['drugs'], allow_empty=True)
+
+    def _combine(self, kind: str) -> pd.DataFrame:
+        frames = list(self.file_frames[kind].values())
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True)
+        if kind == 'drugs':
+            return transform_drugs(df)
+        return remove_duplicate_ids_and_reindex(df, 'id')
+
+    def _append(self, kind: str, new_frames: List[pd.DataFrame]) -> pd.DataFrame:
+        new_rows = remove_duplicate_ids_and_reindex(pd.concat(new_frames, ignore_index=True), 'id')
+        current = self.frames[kind]
+        if 'id' in current.columns:
+            new_rows = new_rows[~new_rows['id'].isin(current['id'])]
+        self.frames[kind] = pd.concat([current, new_rows], ignore_index=True)
+        return new_rows
+
+    def _save_staging(self, rebuilt: set, appended_rows: Dict[str, pd.DataFrame]) -> None:
+        """
+        Met à jour les fichiers du dossier de préparation : une source reconstruite est réécrite
+        entièrement, alors que les lignes ajoutées sont annexées au fichier déjà écrit.
+
+        Args:
+            rebuilt (set): Types de données reconstruits.
+            appended_rows (Dict[str, pd.DataFrame]): Nouvelles lignes de chaque source non reconstruite.
+        """
+        staging_paths = {
+            'drugs': self.cfg.DRUGS_FILE_PATH,
+            'pubmed': self.cfg.PUBMED_FILE_PATH,
+            'clinical_trials': self.cfg.CLINICAL_TRIALS_FILE_PATH
+        }
+        for kind in [*rebuilt, *appended_rows]:
+            path = staging_paths[kind]
+            columns = self.staged_columns.pop(kind, None)
+            try:
+                new_rows = appended_rows.get(kind)
+                if (new_rows is not None and columns is not None and os.path.exists(path)
+                        and set(new_rows.columns) <= set(columns)):
+                    new_rows.reindex(columns=columns).to_csv(path, mode='a', header=False, index=False)
+                else:
+                    # Fichier non encore écrit par la surveillance, ou nouvelles colonnes : réécriture complète
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    self.frames[kind].to_csv(path, index=False)
+                    columns = list(self.frames[kind].columns)
+                self.staged_columns[kind] = columns
+            except Exception as e:
+                logger.error(f"Erreur lors de la sauvegarde du fichier {path}: {e}")
+
+def main() -> None:
+    """
+    Point d'entrée du mode surveillance : charge le dossier Raw puis republie le graphe
+    à chaque fichier ajouté, modifié ou supprimé, jusqu'à interruption (Ctrl+C).
+    """
+    logger.info(f"Démarrage du mode surveillance sur {config.RAW_DATA_DIR}...")
+    watcher = MentionsWatcher()
+    watcher.start()
+    try:
+        while True:
+            time.sleep(config.WATCH_POLL_INTERVAL)
+            try:
+                watcher.poll()
+            except Exception as e:
+                # Une erreur inattendue ne doit pas arrêter la surveillance
+                logger.error(f"Erreur lors du traitement des modifications du dossier Raw: {e}")
+    except KeyboardInterrupt:
+        logger.info("Arrêt du mode surveillance.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+import json
+import os
+
+def write_dataset(data_dir, drugs_csv, pubmed_csv, pubmed_json, clinical_trials_csv):
+    """
+    Écrit les quatre fichiers du dossier Raw d'un jeu de données organisé comme `data/`.
+    `pubmed_json` est la liste d'articles sérialisée dans Src_pubmed.json.
+    """
+    raw_dir = os.path.join(data_dir, "Raw")
+    os.makedirs(raw_dir)
+    with open(os.path.join(raw_dir, "Src_drugs.csv"), "w") as f:
+        f.write(drugs_csv)
+    with open(os.path.join(raw_dir, "Src_pubmed.csv"), "w") as f:
+        f.write(pubmed_csv)
+    with open(os.path.join(raw_dir, "Src_pubmed.json"), "w") as f:
+        json.dump(pubmed_json, f)
+    with open(os.path.join(raw_dir, "Src_clinical_trials.csv"), "w") as f:
+        f.write(clinical_trials_csv)
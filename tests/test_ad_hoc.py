@@ -1,6 +1,7 @@
 import os
 import json
-from src.ad_hoc import export_most_mentioned_journal
+from src.ad_hoc import export_most_mentioned_journal, compute_most_mentioned_journal_sql
+from src.layers.exporter import export_to_sqlite
 from src import config
 
 def test_export_most_mentioned_journal():
@@ -38,3 +39,14 @@ def test_export_most_mentioned_journal():
     # Nettoyer les fichiers de test
     os.remove(test_input_path)
     os.remove(test_output_path)
+
+def test_compute_most_mentioned_journal_sql(tmp_path):
+    test_data = {
+        "DrugA": [{"source": "pubmed", "id": "1", "journal": "Journal1"}, {"source": "pubmed", "id": "2", "journal": "Journal2"}],
+        "DrugB": [{"source": "pubmed", "id": "3", "journal": "Journal1"}]
+    }
+    db_path = str(tmp_path / "mentions.db")
+    export_to_sqlite(test_data, db_path)
+
+    # Même résultat que le calcul pandas sur le graphe JSON
+    assert compute_most_mentioned_journal_sql(db_path) == {"journal": "Journal1", "mentions": 2}
@@ -0,0 +1,35 @@
+import json
+import os
+from src.batch import run_batch
+from tests.datasets import write_dataset
+
+def write_drug_dataset(data_dir, drug):
+    write_dataset(
+        data_dir,
+        f"atccode,drug\nA1,{drug}\n",
+        f"id,title,date,journal\n1,{drug} reduces pain,01/01/2020,Journal A\n",
+        [{"id": "2", "title": "An unrelated article", "date": "2020-02-01", "journal": "Journal B"}],
+        f"id,scientific_title,date,journal\nCT1,Study on {drug},2020-03-01,Journal C\n"
+    )
+
+def test_run_batch(tmp_path):
+    first = str(tmp_path / "fr")
+    second = str(tmp_path / "de")
+    missing = str(tmp_path / "missing")
+    write_drug_dataset(first, "ASPIRIN")
+    write_drug_dataset(second, "IBUPROFEN")
+
+    results = run_batch([first, missing, second], max_workers=2)
+
+    # Les résultats suivent l'ordre des dossiers fournis
+    assert [result["data_dir"] for result in results] == [first, missing, second]
+    assert results[0]["mentions"] == 2
+    assert results[2]["mentions"] == 2
+    # Un jeu de données en erreur est signalé sans interrompre les autres
+    assert "error" in results[1]
+    # Toutes les durées sont mesurées dans le processus du pool
+    assert all(result["seconds"] >= 0 for result in results)
+
+    with open(os.path.join(second, "Result", "link_graph", "drug_mentions_graph.json")) as f:
+        graph = json.load(f)
+    assert list(graph) == ["IBUPROFEN"]
@@ -1,7 +1,9 @@
 import os
 import json
+import sqlite3
 import tempfile
-from src.layers.exporter import export_to_json
+import pandas as pd
+from src.layers.exporter import export_to_json, export_to_sqlite, update_sqlite_mentions
 
 def test_export_to_json():
     data = {"key": "value", "numbers": [1, 2, 3]}
@@ -14,3 +16,68 @@ def test_export_to_json():
         assert exported_data == data
     finally:
         os.remove(tmp_name)
+
+def test_export_to_json_empty(tmp_path):
+    output_path = str(tmp_path / "graph.json")
+    # Un dictionnaire vide est refusé par défaut
+    export_to_json({}, output_path)
+    assert not os.path.exists(output_path)
+    export_to_json({}, output_path, allow_empty=True)
+    with open(output_path, 'r', encoding='utf-8') as f:
+        assert json.load(f) == {}
+
+def test_export_to_sqlite(tmp_path):
+    data = {
+        "DrugA": [
+            {"source": "pubmed", "id": 1, "title": "DrugA study", "journal": "Journal1", "date": "2020-01-01"},
+            {"source": "clinical_trials", "id": "CT1", "title": "DrugA and DrugB", "journal": "Journal2", "date": "2020-02-01"}
+        ],
+        "DrugB": [
+            {"source": "clinical_trials", "id": "CT1", "title": "DrugA and DrugB", "journal": "Journal2", "date": "2020-02-01"}
+        ]
+    }
+    db_path = str(tmp_path / "mentions.db")
+    drugs_df = pd.DataFrame({"atccode": ["A1", "B2", "C3"], "drug": ["DrugA", "DrugB", "DrugC"]})
+    export_to_sqlite(data, db_path, drugs_df)
+
+    connection = sqlite3.connect(db_path)
+    try:
+        assert connection.execute("SELECT COUNT(*) FROM drugs").fetchone()[0] == 3
+        # L'essai clinique mentionné par deux médicaments n'apparaît qu'une fois dans articles
+        assert connection.execute("SELECT COUNT(*) FROM articles").fetchone()[0] == 2
+        assert connection.execute("SELECT COUNT(*) FROM mentions").fetchone()[0] == 3
+        assert connection.execute(
+            "SELECT drug FROM mentions WHERE journal = 'Journal2' ORDER BY drug"
+        ).fetchall() == [("DrugA",), ("DrugB",)]
+        indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {"idx_mentions_drug", "idx_mentions_journal", "idx_mentions_date"} <= indexes
+    finally:
+        connection.close()
+
+def test_update_sqlite_mentions(tmp_path):
+    db_path = str(tmp_path / "mentions.db")
+    export_to_sqlite({
+        "DrugA": [
+            {"source": "pubmed", "id": 1, "title": "DrugA study", "journal": "Journal1", "date": "2020-01-01"},
+            {"source": "clinical_trials", "id": "CT1", "title": "DrugA trial", "journal": "Journal2", "date": "2020-02-01"}
+        ]
+    }, db_path)
+
+    def rows():
+        connection = sqlite3.connect(db_path)
+        try:
+            return sorted(connection.execute("SELECT drug, source, article_id FROM mentions").fetchall())
+        finally:
+            connection.close()
+
+    # Ajout de nouvelles mentions PubMed
+    new_mentions = {"DrugA": [{"source": "pubmed", "id": 2, "title": "DrugA again", "journal": "Journal1", "date": "2020-03-01"}]}
+    assert update_sqlite_mentions(new_mentions, db_path, "pubmed")
+    assert rows() == [("DrugA", "clinical_trials", "CT1"), ("DrugA", "pubmed", "1"), ("DrugA", "pubmed", "2")]
+
+    # Remplacement des mentions PubMed, sans toucher aux essais cliniques
+    assert update_sqlite_mentions(new_mentions, db_path, "pubmed", replace=True)
+    assert rows() == [("DrugA", "clinical_trials", "CT1"), ("DrugA", "pubmed", "2")]
+
+    # Base absente : l'échec est signalé
+    assert not update_sqlite_mentions(new_mentions, str(tmp_path / "missing.db"), "pubmed")
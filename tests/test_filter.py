@@ -0,0 +1,45 @@
+import pandas as pd
+import pytest
+from src.layers.filter import MentionFilter
+
+def test_mention_filter_apply():
+    data = {
+        'journal': ['Journal A', 'Journal B', 'Journal A', 'Journal A'],
+        'date': ['2020-01-01', '2020-02-01', '2020-06-01', '']
+    }
+    df = pd.DataFrame(data)
+    mention_filter = MentionFilter(date_to='2020-03-31', journals=['Journal A'])
+    df_filtered = mention_filter.apply(df)
+    # Seule la première ligne est dans l'intervalle et publiée dans Journal A ; les dates vides sont écartées
+    assert df_filtered['date'].tolist() == ['2020-01-01']
+    assert MentionFilter().apply(df).equals(df)
+
+def test_mention_filter_sources_and_validation():
+    mention_filter = MentionFilter(sources=['pubmed'])
+    assert mention_filter.is_active()
+    assert mention_filter.includes_source('pubmed')
+    assert not mention_filter.includes_source('clinical_trials')
+    assert not MentionFilter().is_active()
+    with pytest.raises(ValueError):
+        MentionFilter(sources=['unknown'])
+    with pytest.raises(ValueError):
+        MentionFilter(date_from='01/02/2020')
+    with pytest.raises(ValueError):
+        MentionFilter(date_from='2020-03-01', date_to='2020-01-01')
+    # Une chaîne seule serait découpée en caractères
+    with pytest.raises(TypeError):
+        MentionFilter(journals='Journal A')
+    with pytest.raises(TypeError):
+        MentionFilter(sources='pubmed')
+
+def test_mention_filter_normalizes_dates():
+    mention_filter = MentionFilter(date_from='2020-1-1', date_to='2020-3-1')
+    assert mention_filter.date_from == '2020-01-01'
+    df = pd.DataFrame({'date': ['2020-01-15', '2020-03-01', '2020-03-02']})
+    assert mention_filter.filter_dates(df)['date'].tolist() == ['2020-01-15', '2020-03-01']
+
+def test_mention_filter_missing_columns():
+    # Un JSON vide donne un DataFrame sans colonnes : aucune ligne retenue, sans erreur
+    df = pd.DataFrame()
+    assert MentionFilter(date_from='2020-01-01').apply(df).empty
+    assert MentionFilter(journals=['Journal A']).apply(df).empty
@@ -32,3 +32,19 @@ def test_load_json_and_load_text():
         assert "value" in text
     finally:
         os.remove(tmp_name)
+
+def test_load_csv_with_row_filter():
+    # Créer un fichier CSV temporaire lu par blocs de deux lignes
+    data = "journal,value\nA,1\nB,2\nA,3\nB,4\nA,5\n"
+    with tempfile.NamedTemporaryFile(mode="w+", suffix=".csv", delete=False) as tmp:
+        tmp.write(data)
+        tmp_name = tmp.name
+    try:
+        df = load_csv(tmp_name, lambda chunk: chunk[chunk["journal"] == "A"], chunksize=2)
+        assert df["value"].tolist() == [1, 3, 5]
+        # Aucun bloc retenu : les colonnes sont conservées
+        df_empty = load_csv(tmp_name, lambda chunk: chunk[chunk["journal"] == "C"], chunksize=2)
+        assert df_empty.empty
+        assert list(df_empty.columns) == ["journal", "value"]
+    finally:
+        os.remove(tmp_name)
@@ -0,0 +1,91 @@
+import json
+import os
+import pytest
+from src import config
+from src import main as main_module
+from src.layers.filter import MentionFilter
+from src.main import build_and_export_graph, parse_arguments
+from tests.datasets import write_dataset
+
+def write_duplicate_id_dataset(data_dir):
+    write_dataset(
+        data_dir,
+        "atccode,drug\nA1,ASPIRIN\nB2,IBUPROFEN\n",
+        # L'ID 5 apparaît deux fois : la construction complète ne garde que la première ligne
+        "id,title,date,journal\n"
+        "5,Unrelated study,01/01/2019,Journal A\n"
+        "5,Aspirin trial,01/01/2020,Journal A\n"
+        "6,Aspirin and fever,15/02/2020,Journal B\n",
+        [
+            {"id": "7", "title": "Ibuprofen dosage", "date": "2020-03-01", "journal": "Journal A"},
+            {"id": 6, "title": "Ibuprofen duplicate", "date": "2020-03-02", "journal": "Journal A"}
+        ],
+        "id,scientific_title,date,journal\n"
+        "CT1,Aspirin in children,2019-06-01,Journal C\n"
+        "CT2,Ibuprofen effectiveness,2020-04-01,Journal A\n"
+    )
+
+def restrict(graph, mention_filter):
+    restricted = {}
+    for drug, mentions in graph.items():
+        kept = [
+            mention for mention in mentions
+            if mention_filter.includes_source(mention["source"])
+            and (mention_filter.journals is None or mention["journal"] in mention_filter.journals)
+            and (mention_filter.date_from is None or mention["date"] >= mention_filter.date_from)
+            and (mention_filter.date_to is None or mention["date"] <= mention_filter.date_to)
+        ]
+        if kept:
+            restricted[drug] = kept
+    return restricted
+
+@pytest.mark.parametrize("mention_filter", [
+    MentionFilter(date_from="2020-01-01"),
+    MentionFilter(date_to="2019-12-31"),
+    MentionFilter(journals=["Journal A"]),
+    MentionFilter(sources=["clinical_trials"]),
+    MentionFilter(date_from="2020-1-1", journals=["Journal A", "Journal B"], sources=["pubmed"]),
+])
+def test_filtered_build_matches_restricted_full_build(tmp_path, mention_filter):
+    write_duplicate_id_dataset(str(tmp_path))
+    cfg = config.resolve_dataset_config(str(tmp_path))
+
+    full_graph = build_and_export_graph(cfg)
+    filtered_graph = build_and_export_graph(cfg, mention_filter)
+    assert filtered_graph == restrict(full_graph, mention_filter)
+
+    # Les sorties complètes ne sont pas écrasées par l'exécution filtrée
+    with open(cfg.OUTPUT_JSON_PATH, "r", encoding="utf-8") as f:
+        assert json.load(f) == full_graph
+    with open(cfg.FILTERED_OUTPUT_JSON_PATH, "r", encoding="utf-8") as f:
+        assert json.load(f) == filtered_graph
+
+def test_filtered_build_without_match_exports_empty_graph(tmp_path):
+    write_duplicate_id_dataset(str(tmp_path))
+    cfg = config.resolve_dataset_config(str(tmp_path))
+    output_path = str(tmp_path / "nope.json")
+
+    graph = build_and_export_graph(cfg, MentionFilter(journals=["Nope"]), output_path)
+    assert graph == {}
+    with open(output_path, "r", encoding="utf-8") as f:
+        assert json.load(f) == {}
+    assert os.path.exists(str(tmp_path / "nope.db"))
+
+def test_output_path_must_not_be_a_database(tmp_path):
+    write_duplicate_id_dataset(str(tmp_path))
+    cfg = config.resolve_dataset_config(str(tmp_path))
+
+    with pytest.raises(SystemExit):
+        build_and_export_graph(cfg, output_path=str(tmp_path / "graph.db"))
+    assert not os.path.exists(str(tmp_path / "graph.db"))
+    with pytest.raises(SystemExit):
+        parse_arguments(["--output", "graph.db"])
+
+def test_failed_sqlite_export_exits(tmp_path, monkeypatch):
+    write_duplicate_id_dataset(str(tmp_path))
+    cfg = config.resolve_dataset_config(str(tmp_path))
+    monkeypatch.setattr(main_module, "export_to_sqlite", lambda *args, **kwargs: False)
+
+    # Un échec de l'export SQLite n'est pas présenté comme un succès
+    with pytest.raises(SystemExit):
+        build_and_export_graph(cfg)
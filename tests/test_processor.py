@@ -1,5 +1,6 @@
 import pandas as pd
-from src.layers.processor import build_drug_mentions_graph
+from src.layers.filter import MentionFilter
+from src.layers.processor import build_drug_mentions_graph, compile_drug_matchers
 
 def test_build_drug_mentions_graph():
     # Données d'exemple pour les médicaments
@@ -32,3 +33,33 @@ def test_build_drug_mentions_graph():
     # Ibuprofen devrait avoir une mention dans les essais cliniques
     assert 'Ibuprofen' in graph
     assert len(graph['Ibuprofen']) == 1
+
+def test_build_drug_mentions_graph_with_filter():
+    drugs_df = pd.DataFrame({'drug': ['Aspirin']})
+    pubmed_df = pd.DataFrame({
+        'id': ['1', '2'],
+        'title': ['Aspirin reduces pain', 'Aspirin and fever'],
+        'journal': ['Journal A', 'Journal B'],
+        'date': ['2020-01-01', '2020-06-01']
+    })
+    clinical_trials_df = pd.DataFrame({
+        'id': ['CT1'],
+        'scientific_title': ['Study on Aspirin'],
+        'journal': ['Journal A'],
+        'date': ['2020-01-15']
+    })
+
+    graph = build_drug_mentions_graph(
+        drugs_df, pubmed_df, clinical_trials_df,
+        mention_filter=MentionFilter(date_to='2020-03-31', sources=['pubmed'])
+    )
+    # Seul l'article PubMed du premier trimestre est retenu
+    assert [mention['id'] for mention in graph['Aspirin']] == ['1']
+
+def test_compile_drug_matchers_is_cached_and_immutable():
+    drugs_df = pd.DataFrame({'drug': ['Aspirin', 'Ibuprofen', 'Aspirin']})
+    matchers = compile_drug_matchers(drugs_df)
+    # Les doublons sont ignorés et le résultat en cache est un tuple partagé
+    assert [drug for drug, _ in matchers] == ['Aspirin', 'Ibuprofen']
+    assert isinstance(matchers, tuple)
+    assert compile_drug_matchers(drugs_df.copy()) is matchers
@@ -0,0 +1,102 @@
+import json
+import os
+import sqlite3
+from src import config
+from src import watcher as watcher_module
+from src.watcher import MentionsWatcher, classify_raw_file
+
+def sqlite_mentions(db_path):
+    connection = sqlite3.connect(db_path)
+    try:
+        return sorted(connection.execute("SELECT drug, source, article_id FROM mentions").fetchall())
+    finally:
+        connection.close()
+
+def graph_mentions(graph):
+    return sorted((drug, m["source"], str(m["id"])) for drug, mentions in graph.items() for m in mentions)
+
+def test_classify_raw_file():
+    assert classify_raw_file("Src_drugs.csv") == "drugs"
+    assert classify_raw_file("Src_pubmed_2020_02.json") == "pubmed"
+    assert classify_raw_file("Src_clinical_trials.csv") == "clinical_trials"
+    assert classify_raw_file("notes.txt") is None
+
+def test_watcher_processes_new_file(tmp_path, monkeypatch):
+    cfg = config.resolve_dataset_config(str(tmp_path))
+    raw_dir = tmp_path / "Raw"
+    raw_dir.mkdir()
+    (raw_dir / "Src_drugs.csv").write_text("atccode,drug\nA1,ASPIRIN\nB2,IBUPROFEN\n")
+    (raw_dir / "Src_pubmed.csv").write_text("id,title,date,journal\n1,Aspirin reduces pain,01/01/2020,Journal A\n")
+    (raw_dir / "Src_clinical_trials.csv").write_text("id,scientific_title,date,journal\nCT1,Another study,01/02/2020,Journal C\n")
+
+    output_path = tmp_path / "Result" / "link_graph" / "drug_mentions_graph.json"
+
+    # Compte les exports complets de la base SQLite
+    full_exports = []
+    export_to_sqlite = watcher_module.export_to_sqlite
+
+    def counting_export_to_sqlite(*args, **kwargs):
+        full_exports.append(args)
+        return export_to_sqlite(*args, **kwargs)
+
+    monkeypatch.setattr(watcher_module, "export_to_sqlite", counting_export_to_sqlite)
+
+    watcher = MentionsWatcher(cfg)
+    watcher.start()
+    graph = json.loads(output_path.read_text())
+    assert list(graph) == ["ASPIRIN"]
+    assert len(full_exports) == 1
+
+    # Un nouveau fichier n'est traité qu'une fois sa signature stable entre deux scans
+    (raw_dir / "Src_clinical_trials_2.csv").write_text(
+        "id,scientific_title,date,journal\nCT2,Ibuprofen effectiveness,2020-03-01,Journal D\n"
+    )
+    assert watcher.poll() is False
+    assert watcher.poll() is True
+    graph = json.loads(output_path.read_text())
+    assert graph["IBUPROFEN"][0]["id"] == "CT2"
+    assert graph["IBUPROFEN"][0]["source"] == "clinical_trials"
+    # La base SQLite est mise à jour en place, sans nouvel export complet
+    assert len(full_exports) == 1
+    assert sqlite_mentions(cfg.SQLITE_OUTPUT_PATH) == graph_mentions(watcher.graph)
+    # Les nouvelles lignes sont annexées au fichier de préparation
+    with open(cfg.CLINICAL_TRIALS_FILE_PATH) as f:
+        assert [line.split(",")[0] for line in f.read().splitlines()] == ["id", "CT1", "CT2"]
+
+    # La suppression du fichier retire ses mentions du graphe
+    os.remove(raw_dir / "Src_clinical_trials_2.csv")
+    assert watcher.poll() is True
+    graph = json.loads(output_path.read_text())
+    assert "IBUPROFEN" not in graph
+    assert len(full_exports) == 1
+    assert sqlite_mentions(cfg.SQLITE_OUTPUT_PATH) == graph_mentions(watcher.graph)
+
+    # Sans fichier des médicaments, le graphe publié est vide
+    os.remove(raw_dir / "Src_drugs.csv")
+    assert watcher.poll() is True
+    assert watcher.graph == {}
+    assert json.loads(output_path.read_text()) == {}
+    assert sqlite_mentions(cfg.SQLITE_OUTPUT_PATH) == []
+
+def test_watcher_rejects_malformed_drugs_file(tmp_path):
+    cfg = config.resolve_dataset_config(str(tmp_path))
+    raw_dir = tmp_path / "Raw"
+    raw_dir.mkdir()
+    (raw_dir / "Src_drugs.csv").write_text("atccode,drug\nA1,ASPIRIN\n")
+    (raw_dir / "Src_pubmed.csv").write_text("id,title,date,journal\n1,Aspirin reduces pain,01/01/2020,Journal A\n")
+
+    watcher = MentionsWatcher(cfg)
+    watcher.start()
+
+    # Un fichier des médicaments sans colonne 'drug' est rejeté sans arrêter la surveillance
+    (raw_dir / "Src_drugs_2.csv").write_text("atccode\nB2\n")
+    assert watcher.poll() is False
+    assert watcher.poll() is True
+    assert str(raw_dir / "Src_drugs_2.csv") not in watcher.file_frames["drugs"]
+    assert list(watcher.graph) == ["ASPIRIN"]
+
+    # Le fichier suivant est traité normalement
+    (raw_dir / "Src_pubmed_2.csv").write_text("id,title,date,journal\n2,Aspirin and fever,02/01/2020,Journal B\n")
+    watcher.poll()
+    assert watcher.poll() is True
+    assert [str(m["id"]) for m in watcher.graph["ASPIRIN"]] == ["1", "2"]